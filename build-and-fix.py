@@ -6,13 +6,36 @@ This script will install dependencies, identify issues, and attempt to fix them
 
 import os
 import sys
+import signal
 import json
 import subprocess
 import shutil
+import threading
+import hashlib
+import concurrent.futures
 from pathlib import Path
 from datetime import datetime
 import argparse
 
+try:
+    from blake3 import blake3
+except ImportError:  # optional, only speeds up build cache hashing
+    blake3 = None
+
+# Tool versions detected by check_system_requirements, reused by generate_report
+_versions = {}
+
+# Project paths, resolved once from the script location
+ROOT_DIR = Path(__file__).resolve().parent
+FRONTEND_DIR = ROOT_DIR / "frontend"
+DIST_DIR = FRONTEND_DIR / "dist"
+PUBLIC_DIR = ROOT_DIR / "public"
+TSCONFIG_PATH = FRONTEND_DIR / "tsconfig.json"
+REPORT_PATH = ROOT_DIR / "build-report.txt"
+
+# Build state (lockfile hashes) kept between invocations
+BUILD_CACHE_DIR = ROOT_DIR / ".build-cache"
+
 class Colors:
     GREEN = '\033[92m'
     RED = '\033[91m'
@@ -23,27 +46,72 @@ class Colors:
     END = '\033[0m'
     BOLD = '\033[1m'
 
+# Escape codes are just noise when output is redirected to a log
+if not sys.stdout.isatty() or os.environ.get("NO_COLOR"):
+    for attr in vars(Colors).copy():
+        if not attr.startswith("_"):
+            setattr(Colors, attr, "")
+
+# Serializes output from the concurrent setup tasks so lines don't interleave
+_print_lock = threading.Lock()
+
+_SUCCESS = f"{Colors.GREEN}✅ {{}}{Colors.END}"
+_ERROR = f"{Colors.RED}❌ {{}}{Colors.END}"
+_WARNING = f"{Colors.YELLOW}⚠️ {{}}{Colors.END}"
+_INFO = f"{Colors.CYAN}ℹ️ {{}}{Colors.END}"
+_STEP = f"{Colors.BLUE}🔄 {{}}{Colors.END}"
+
+def _emit(text):
+    with _print_lock:
+        print(text)
+
 def print_success(message):
-    print(f"{Colors.GREEN}✅ {message}{Colors.END}")
+    _emit(_SUCCESS.format(message))
 
 def print_error(message):
-    print(f"{Colors.RED}❌ {message}{Colors.END}")
+    _emit(_ERROR.format(message))
 
 def print_warning(message):
-    print(f"{Colors.YELLOW}⚠️ {message}{Colors.END}")
+    _emit(_WARNING.format(message))
 
 def print_info(message):
-    print(f"{Colors.CYAN}ℹ️ {message}{Colors.END}")
+    _emit(_INFO.format(message))
 
 def print_step(message):
-    print(f"{Colors.BLUE}🔄 {message}{Colors.END}")
+    _emit(_STEP.format(message))
+
+# Resolved executable paths, looked up once per run
+_executables = {}
+
+def resolve_executable(name):
+    """Resolve a program to its full path (e.g. npm.cmd on Windows) so it runs without a shell"""
+    if name not in _executables:
+        _executables[name] = shutil.which(name) or name
+    return _executables[name]
 
-def run_command(command, cwd=None, capture_output=True):
-    """Run a command and return result"""
+def _new_process_group():
+    """Popen arguments that start a child in its own process group"""
+    if os.name == "nt":
+        return {"creationflags": subprocess.CREATE_NEW_PROCESS_GROUP}
+    return {"start_new_session": True}
+
+def kill_process_tree(process):
+    """Kill a child started in its own process group along with everything it spawned"""
+    try:
+        if os.name == "nt":
+            subprocess.run(["taskkill", "/T", "/F", "/PID", str(process.pid)], capture_output=True)
+        else:
+            os.killpg(process.pid, signal.SIGKILL)
+    except (OSError, subprocess.SubprocessError):
+        process.kill()
+
+def run_command(args, cwd=None, capture_output=True):
+    """Run a command given as an argument list and return result"""
+    args = [resolve_executable(args[0]), *args[1:]]
+    command = " ".join(args)
     try:
         result = subprocess.run(
-            command, 
-            shell=True, 
+            args, 
             cwd=cwd, 
             capture_output=capture_output,
             text=True,
@@ -57,14 +125,76 @@ def run_command(command, cwd=None, capture_output=True):
         print_error(f"Command failed: {command} - {e}")
         return None
 
+def run_command_streaming(args, cwd=None, watch=(), timeout=300):
+    """Run a long command, echoing its output line by line as it is produced.
+    
+    Lines containing any of the ``watch`` substrings are kept in the result's stdout.
+    """
+    args = [resolve_executable(args[0]), *args[1:]]
+    command = " ".join(args)
+    try:
+        process = subprocess.Popen(
+            args,
+            cwd=cwd,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            bufsize=1,
+            encoding="utf-8",
+            errors="replace",
+            **_new_process_group()
+        )
+    except Exception as e:
+        print_error(f"Command failed: {command} - {e}")
+        return None
+    
+    # Reading stdout blocks, so enforce the timeout from a timer instead. The whole
+    # process group is killed because tsc/vite children hold the pipe open too.
+    timed_out = threading.Event()
+    def kill():
+        timed_out.set()
+        kill_process_tree(process)
+    timer = threading.Timer(timeout, kill)
+    timer.start()
+    matches = []
+    try:
+        for line in process.stdout:
+            print(line, end="")
+            if any(pattern in line for pattern in watch):
+                matches.append(line)
+        process.wait()
+    except Exception as e:
+        kill_process_tree(process)
+        print_error(f"Command failed: {command} - {e}")
+        return None
+    except BaseException:
+        kill_process_tree(process)
+        raise
+    finally:
+        timer.cancel()
+        process.stdout.close()
+    
+    if timed_out.is_set():
+        print_error(f"Command timed out: {command}")
+        return None
+    return subprocess.CompletedProcess(args, process.returncode, stdout="".join(matches))
+
+def list_directory(path):
+    """Return the set of entry names in a directory (empty if it does not exist)"""
+    try:
+        with os.scandir(path) as entries:
+            return {entry.name for entry in entries}
+    except OSError:
+        return set()
+
 def check_system_requirements():
     """Check if Node.js and npm are installed with correct versions"""
     print_step("Checking system requirements...")
     
     # Check Node.js
-    result = run_command("node --version")
+    result = run_command(["node", "--version"])
     if result and result.returncode == 0:
         node_version = result.stdout.strip()
+        _versions['node'] = node_version
         major_version = int(node_version.lstrip('v').split('.')[0])
         if major_version >= 16:
             print_success(f"Node.js {node_version} detected")
@@ -76,9 +206,10 @@ def check_system_requirements():
         return False
     
     # Check npm
-    result = run_command("npm --version")
+    result = run_command(["npm", "--version"])
     if result and result.returncode == 0:
         npm_version = result.stdout.strip()
+        _versions['npm'] = npm_version
         print_success(f"npm {npm_version} detected")
     else:
         print_error("npm not found. Please ensure npm is installed with Node.js")
@@ -86,45 +217,208 @@ def check_system_requirements():
     
     return True
 
-def install_dependencies(skip_install=False):
+def npm_install_command(cwd, label):
+    """Pick the npm install command for a tree based on its lockfile"""
+    if (Path(cwd) / "package-lock.json").exists():
+        # Install straight from the lockfile without re-resolving the dependency tree
+        return ["npm", "ci", "--no-audit", "--no-fund", "--prefer-offline"]
+    print_warning(f"{label} package-lock.json not found. Commit it for faster, reproducible installs.")
+    return ["npm", "install", "--no-audit", "--no-fund"]
+
+def hash_file(path):
+    """Return the SHA-256 hex digest of a file"""
+    return hashlib.sha256(Path(path).read_bytes()).hexdigest()
+
+def _lock_hash_path(label):
+    return BUILD_CACHE_DIR / f"{label.lower()}-package-lock.sha256"
+
+def _install_needed(root, label):
+    """Check whether a tree's node_modules is stale relative to its lockfile"""
+    lockfile = root / "package-lock.json"
+    try:
+        lock_mtime = lockfile.stat().st_mtime
+        # npm writes this hidden lockfile at the end of every successful install
+        installed_mtime = (root / "node_modules" / ".package-lock.json").stat().st_mtime
+    except OSError:
+        return True
+    if installed_mtime >= lock_mtime:
+        return False
+    
+    # The lockfile may only have been touched (e.g. by a git checkout), so compare contents
+    try:
+        return _lock_hash_path(label).read_text().strip() != hash_file(lockfile)
+    except OSError:
+        return True
+
+def _record_install(root, label):
+    """Remember the lockfile an install was made from"""
+    lockfile = root / "package-lock.json"
+    if lockfile.exists():
+        BUILD_CACHE_DIR.mkdir(exist_ok=True)
+        _lock_hash_path(label).write_text(hash_file(lockfile))
+
+# Files whose contents decide whether a previous install + build can be reused,
+# relative to ROOT_DIR
+BUILD_INPUTS = [
+    "package.json",
+    "package-lock.json",
+    "frontend/package.json",
+    "frontend/package-lock.json",
+    "frontend/tsconfig.json",
+    "frontend/tsconfig.node.json",
+    "frontend/index.html",
+    "frontend/vite.config.ts",
+    "frontend/tailwind.config.js",
+]
+# Vite bakes .env* values into the bundle; postcss config may use any extension
+BUILD_INPUT_GLOBS = ["frontend/.env*", "frontend/postcss.config.*", "frontend/.postcssrc*"]
+BUILD_INPUT_DIRS = ["frontend/src", "frontend/public"]
+
+def compute_build_state():
+    """Hash every build input into a path -> digest dict"""
+    paths = [ROOT_DIR / path for path in BUILD_INPUTS]
+    for pattern in BUILD_INPUT_GLOBS:
+        paths.extend(path for path in ROOT_DIR.glob(pattern) if path.is_file())
+    for directory in BUILD_INPUT_DIRS:
+        for root, _, files in os.walk(ROOT_DIR / directory):
+            paths.extend(Path(root, name) for name in files)
+    
+    algorithm = "blake3" if blake3 else "sha256"
+    state = {"algorithm": algorithm, "files": {}}
+    for path in sorted(paths):
+        key = path.relative_to(ROOT_DIR).as_posix()
+        try:
+            data = path.read_bytes()
+        except OSError:
+            state["files"][key] = None
+            continue
+        digest = blake3(data) if blake3 else hashlib.sha256(data)
+        state["files"][key] = digest.hexdigest()
+    return state
+
+def load_build_state():
+    """Return the build state saved by the last successful build, if any"""
+    try:
+        return json.loads((BUILD_CACHE_DIR / "state.json").read_text())
+    except (OSError, ValueError):
+        return None
+
+def save_build_state(state):
+    BUILD_CACHE_DIR.mkdir(exist_ok=True)
+    (BUILD_CACHE_DIR / "state.json").write_text(json.dumps(state, indent=2))
+
+# Install processes still running. They are detached from the terminal's process
+# group, so Ctrl-C never reaches them and main has to kill them itself
+_live_installs = set()
+_live_installs_lock = threading.Lock()
+_installs_cancelled = threading.Event()
+
+def kill_live_installs():
+    """Kill every running install and stop new ones from starting"""
+    with _live_installs_lock:
+        _installs_cancelled.set()
+        for process in _live_installs:
+            kill_process_tree(process)
+
+def _start_install(cwd, label):
+    """Start an npm install with its output captured, or return None if it can't start"""
+    command = npm_install_command(cwd, label)
+    with _live_installs_lock:
+        if _installs_cancelled.is_set():
+            return None
+        try:
+            process = subprocess.Popen(
+                [resolve_executable(command[0]), *command[1:]],
+                cwd=cwd,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT,
+                encoding="utf-8",
+                errors="replace",
+                **_new_process_group()
+            )
+        except Exception as e:
+            print_error(f"Command failed: {' '.join(command)} - {e}")
+            return None
+        _live_installs.add(process)
+        return process
+
+def _finish_install(cwd, label, process):
+    """Wait for an install started by _start_install and report its output as one block"""
+    output = ""
+    returncode = None
+    if process is not None:
+        try:
+            output, _ = process.communicate(timeout=300)  # 5 minute timeout
+            returncode = process.returncode
+        except subprocess.TimeoutExpired:
+            # Kill npm's lifecycle/postinstall children too, they hold the output pipe open
+            kill_process_tree(process)
+            try:
+                output, _ = process.communicate(timeout=10)
+            except subprocess.TimeoutExpired:
+                output = ""
+            print_error(f"Command timed out: {label.lower()} dependency install")
+        finally:
+            with _live_installs_lock:
+                _live_installs.discard(process)
+    
+    # Other setup tasks print concurrently, so keep the whole log together
+    with _print_lock:
+        print(_INFO.format(f"{label} install output:"))
+        if output:
+            print(output, end="" if output.endswith("\n") else "\n")
+    
+    if returncode == 0:
+        _record_install(cwd, label)
+        print_success(f"{label} dependencies installed")
+        return True
+    print_error(f"Failed to install {label.lower()} dependencies")
+    return False
+
+def install_dependencies(skip_install=False, parallel=True, force=False):
     """Install backend and frontend dependencies"""
     if skip_install:
         print_info("Skipping dependency installation")
         return True
     
-    print_step("Installing backend dependencies...")
-    result = run_command("npm install", capture_output=False)
-    if result and result.returncode == 0:
-        print_success("Backend dependencies installed")
-    else:
-        print_error("Failed to install backend dependencies")
-        return False
-    
-    print_step("Installing frontend dependencies...")
-    frontend_path = Path("frontend")
-    if frontend_path.exists():
-        result = run_command("npm install", cwd=frontend_path, capture_output=False)
-        if result and result.returncode == 0:
-            print_success("Frontend dependencies installed")
-        else:
-            print_error("Failed to install frontend dependencies")
-            return False
+    # The two trees have disjoint node_modules, so they can install side by side
+    targets = [(ROOT_DIR, "Backend")]
+    if FRONTEND_DIR.exists():
+        targets.append((FRONTEND_DIR, "Frontend"))
     else:
         print_warning("Frontend directory not found")
     
-    return True
+    if not force:
+        for cwd, label in list(targets):
+            if not _install_needed(cwd, label):
+                print_success(f"{label} dependencies up to date, skipping install")
+                targets.remove((cwd, label))
+    if not targets:
+        return True
+    
+    if not parallel:
+        for cwd, label in targets:
+            print_step(f"Installing {label.lower()} dependencies...")
+            if not _finish_install(cwd, label, _start_install(cwd, label)):
+                return False
+        return True
+    
+    print_step(f"Installing {' and '.join(label.lower() for _, label in targets)} dependencies in parallel...")
+    processes = [(cwd, label, _start_install(cwd, label)) for cwd, label in targets]
+    results = [_finish_install(cwd, label, process) for cwd, label, process in processes]
+    return all(results)
 
 def fix_typescript_config():
     """Fix TypeScript configuration for React 18 compatibility"""
     print_step("Fixing TypeScript and React configuration issues...")
     
-    tsconfig_path = Path("frontend/tsconfig.json")
-    if tsconfig_path.exists():
+    if TSCONFIG_PATH.exists():
         try:
-            with open(tsconfig_path, 'r') as f:
+            with open(TSCONFIG_PATH, 'r') as f:
                 tsconfig = json.load(f)
             
             # Ensure proper TypeScript configuration for React 18
+            original_options = json.dumps(tsconfig.get("compilerOptions", {}), sort_keys=True)
             compiler_options = tsconfig.get("compilerOptions", {})
             compiler_options.update({
                 "jsx": "react-jsx",
@@ -137,9 +431,14 @@ def fix_typescript_config():
                 "strictNullChecks": False
             })
             
+            # Leave an unchanged file alone so tsc's incremental build info stays valid
+            if json.dumps(compiler_options, sort_keys=True) == original_options:
+                print_success("TypeScript configuration already up to date")
+                return True
+            
             tsconfig["compilerOptions"] = compiler_options
             
-            with open(tsconfig_path, 'w') as f:
+            with open(TSCONFIG_PATH, 'w') as f:
                 json.dump(tsconfig, f, indent=2)
             
             print_success("TypeScript configuration updated")
@@ -156,71 +455,125 @@ def fix_react_components():
     print_step("Fixing React component issues...")
     
     # List of component files to check
+    src_dir = FRONTEND_DIR / "src"
     component_files = [
-        "frontend/src/main.tsx",
-        "frontend/src/App.tsx", 
-        "frontend/src/context/AirQualityContext.tsx",
-        "frontend/src/components/LoadingSpinner.tsx",
-        "frontend/src/components/ErrorBoundary.tsx",
-        "frontend/src/components/AQICard.tsx",
-        "frontend/src/components/WeatherCard.tsx",
-        "frontend/src/components/AlertsPanel.tsx",
-        "frontend/src/components/TrendChart.tsx"
+        src_dir / "main.tsx",
+        src_dir / "App.tsx", 
+        src_dir / "context" / "AirQualityContext.tsx",
+        src_dir / "components" / "LoadingSpinner.tsx",
+        src_dir / "components" / "ErrorBoundary.tsx",
+        src_dir / "components" / "AQICard.tsx",
+        src_dir / "components" / "WeatherCard.tsx",
+        src_dir / "components" / "AlertsPanel.tsx",
+        src_dir / "components" / "TrendChart.tsx"
     ]
     
-    existing_files = [f for f in component_files if Path(f).exists()]
+    # One directory listing per parent instead of a stat per file
+    listings = {}
+    existing_files = []
+    for f in component_files:
+        if f.parent not in listings:
+            listings[f.parent] = list_directory(f.parent)
+        if f.name in listings[f.parent]:
+            existing_files.append(f)
     print_info(f"Found {len(existing_files)} component files to check")
     
     return True
 
+def link_or_copy(src, dst):
+    """Hardlink src to dst, falling back to a real copy across devices"""
+    if os.path.lexists(dst):
+        if os.path.samefile(src, dst):
+            return dst
+        os.unlink(dst)
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copy2(src, dst)
+    return dst
+
+def deploy_build(dist_path, public_path):
+    """Sync the frontend build into the public directory"""
+    # Drop anything in public/ that the new build no longer produces
+    if public_path.exists():
+        for root, dirs, files in os.walk(public_path, topdown=False):
+            rel_root = Path(root).relative_to(public_path)
+            for name in files:
+                if not (dist_path / rel_root / name).is_file():
+                    os.unlink(Path(root) / name)
+            for name in dirs:
+                path = Path(root) / name
+                if os.path.islink(path):
+                    # Never copy through a symlinked directory into whatever it points at
+                    os.unlink(path)
+                elif not (dist_path / rel_root / name).is_dir():
+                    shutil.rmtree(path)
+    
+    shutil.copytree(dist_path, public_path, dirs_exist_ok=True, copy_function=link_or_copy)
+
+def deploy_frontend():
+    """Copy the frontend build to the backend public directory"""
+    if not DIST_DIR.exists():
+        print_error("Build directory not found after successful build")
+        return False
+    try:
+        deploy_build(DIST_DIR, PUBLIC_DIR)
+    except OSError as e:  # includes shutil.Error from copytree
+        print_error(f"Failed to deploy frontend build: {e}")
+        return False
+    print_success("Frontend deployed to backend public directory")
+    return True
+
+# TypeScript errors that mean @types/node is not installed
+MISSING_NODE_TYPES_ERRORS = (
+    "Cannot find module '@types/node'",
+    "Cannot find type definition file for 'node'",
+    "install type definitions for node",
+)
+
 def build_frontend():
-    """Build the frontend application"""
+    """Build the frontend application and deploy it to the public directory"""
     print_step("Building frontend application...")
     
-    frontend_path = Path("frontend")
+    frontend_path = FRONTEND_DIR
     if not frontend_path.exists():
         print_error("Frontend directory not found")
         return False
     
-    # First try type checking
-    print_info("Running TypeScript type check...")
-    result = run_command("npm run type-check", cwd=frontend_path)
-    if result and result.returncode == 0:
-        print_success("TypeScript type check passed")
-    else:
-        print_warning("TypeScript issues detected. Continuing with build...")
-    
-    # Build the application
-    print_info("Building frontend application...")
-    result = run_command("npm run build", cwd=frontend_path, capture_output=False)
+    # The build script runs "tsc && vite build", so it type-checks as part of the build
+    print_info("Building frontend application (includes TypeScript type check)...")
+    result = run_command_streaming(["npm", "run", "build"], cwd=frontend_path, watch=MISSING_NODE_TYPES_ERRORS)
     
     if result and result.returncode == 0:
         print_success("Frontend build completed successfully!")
         
         # Copy build to backend public directory
-        dist_path = frontend_path / "dist"
-        public_path = Path("public")
-        
-        if dist_path.exists():
-            if public_path.exists():
-                shutil.rmtree(public_path)
-            shutil.copytree(dist_path, public_path)
-            print_success("Frontend deployed to backend public directory")
-            return True
-        else:
-            print_error("Build directory not found after successful build")
-            return False
+        return deploy_frontend()
     else:
         print_error("Frontend build failed")
         
-        # Try to install missing dependencies and retry
-        print_warning("Installing additional dependencies and retrying...")
-        run_command("npm install @types/node --save-dev", cwd=frontend_path)
+        if result is None:
+            # Timed out or could not start; the reason has already been printed
+            print_error("Build did not complete. Manual intervention required.")
+            return False
+        
+        # Only a missing @types/node is worth an install and retry
+        if not result.stdout:
+            print_error("Build failure is not caused by missing Node.js types. Manual intervention required.")
+            return False
         
-        result = run_command("npm run build", cwd=frontend_path, capture_output=False)
+        print_warning("Node.js type definitions missing. Installing @types/node and retrying...")
+        install = run_command(["npm", "install", "@types/node", "--no-save", "--no-audit", "--no-fund"], cwd=frontend_path)
+        if not (install and install.returncode == 0):
+            if install and install.stderr:
+                print(install.stderr)
+            print_error("Failed to install @types/node. Manual intervention required.")
+            return False
+        
+        result = run_command_streaming(["npm", "run", "build"], cwd=frontend_path)
         if result and result.returncode == 0:
             print_success("Build successful after dependency fix!")
-            return True
+            return deploy_frontend()
         else:
             print_error("Build still failing. Manual intervention required.")
             return False
@@ -230,8 +583,8 @@ def test_backend():
     print_step("Testing backend startup...")
     
     # Check for .env file
-    env_path = Path(".env")
-    env_example_path = Path(".env.example")
+    env_path = ROOT_DIR / ".env"
+    env_example_path = ROOT_DIR / ".env.example"
     
     if not env_path.exists() and env_example_path.exists():
         shutil.copy(env_example_path, env_path)
@@ -244,20 +597,25 @@ def generate_report():
     """Generate a comprehensive build report"""
     print_step("Generating build report...")
     
-    # Get version information
-    node_result = run_command("node --version")
-    npm_result = run_command("npm --version")
+    # Get version information, only querying tools that were not already checked
+    for tool in ("node", "npm"):
+        if tool not in _versions:
+            result = run_command([tool, "--version"])
+            if result and result.returncode == 0:
+                _versions[tool] = result.stdout.strip()
     
-    node_version = node_result.stdout.strip() if node_result and node_result.returncode == 0 else "Unknown"
-    npm_version = npm_result.stdout.strip() if npm_result and npm_result.returncode == 0 else "Unknown"
+    node_version = _versions.get("node", "Unknown")
+    npm_version = _versions.get("npm", "Unknown")
     
-    # Check component status
+    # Check component status with one listing per directory
+    roots = {".": list_directory(ROOT_DIR), "frontend": list_directory(FRONTEND_DIR)}
+    frontend_dist_exists = "dist" in roots["frontend"]
     components_status = {
-        "Backend Dependencies": "✅ Installed" if Path("node_modules").exists() else "❌ Missing",
-        "Frontend Dependencies": "✅ Installed" if Path("frontend/node_modules").exists() else "❌ Missing",
-        "Frontend Build": "✅ Built" if Path("frontend/dist").exists() else "❌ Failed",
-        "Public Assets": "✅ Deployed" if Path("public").exists() else "❌ Missing",
-        "Environment Config": "✅ Present" if Path(".env").exists() else "❌ Missing"
+        "Backend Dependencies": "✅ Installed" if "node_modules" in roots["."] else "❌ Missing",
+        "Frontend Dependencies": "✅ Installed" if "node_modules" in roots["frontend"] else "❌ Missing",
+        "Frontend Build": "✅ Built" if frontend_dist_exists else "❌ Failed",
+        "Public Assets": "✅ Deployed" if "public" in roots["."] else "❌ Missing",
+        "Environment Config": "✅ Present" if ".env" in roots["."] else "❌ Missing"
     }
     
     report = f"""
@@ -275,7 +633,7 @@ COMPONENTS STATUS:
     
     report += "\nNEXT STEPS:\n"
     
-    if Path("frontend/dist").exists():
+    if frontend_dist_exists:
         report += """✅ Application is ready to run!
    
    To start the application:
@@ -294,19 +652,23 @@ COMPONENTS STATUS:
     
     print(report)
     
-    # Save report to file
-    with open("build-report.txt", "w") as f:
-        f.write(report)
+    # Save report to file, swapping it in atomically so readers never see a partial report
+    tmp_path = REPORT_PATH.with_name(REPORT_PATH.name + ".tmp")
+    tmp_path.write_text(report, encoding="utf-8")
+    os.replace(tmp_path, REPORT_PATH)
     
-    print_info("Build report saved to build-report.txt")
+    print_info(f"Build report saved to {REPORT_PATH.name}")
     
-    return Path("frontend/dist").exists()
+    return frontend_dist_exists
 
 def main():
     parser = argparse.ArgumentParser(description="Air Quality Monitoring Build Script")
     parser.add_argument("--skip-install", action="store_true", help="Skip dependency installation")
     parser.add_argument("--verbose", action="store_true", help="Verbose output")
     parser.add_argument("--fix-only", action="store_true", help="Only run fixes, skip build")
+    parser.add_argument("--no-parallel-install", action="store_true", help="Install backend and frontend dependencies one after another")
+    parser.add_argument("--force-install", action="store_true", help="Reinstall dependencies even if node_modules is up to date")
+    parser.add_argument("--no-build-cache", action="store_true", help="Always install and build, even if no build inputs changed")
     
     args = parser.parse_args()
     
@@ -321,8 +683,7 @@ This script will:
 {Colors.END}""")
     
     # Ensure we're in the right directory
-    script_dir = Path(__file__).parent
-    os.chdir(script_dir)
+    os.chdir(ROOT_DIR)
     
     success = True
     
@@ -330,27 +691,51 @@ This script will:
     if not check_system_requirements():
         sys.exit(1)
     
-    # Install dependencies
-    if not install_dependencies(args.skip_install):
-        success = False
-    
-    # Fix configuration issues
-    if not fix_typescript_config():
-        success = False
-    
-    # Fix React components
-    if not fix_react_components():
-        success = False
+    # Nothing to install or build if the inputs match the last successful build
+    cache_hit = False
+    if not args.fix_only and not args.no_build_cache and not args.force_install:
+        cache_hit = (
+            compute_build_state() == load_build_state()
+            and PUBLIC_DIR.exists()
+            and DIST_DIR.exists()
+            and (ROOT_DIR / "node_modules").exists()
+            and (FRONTEND_DIR / "node_modules").exists()
+        )
+        if cache_hit:
+            print_success("Build inputs unchanged since last successful build (cache hit), skipping install and build")
     
-    # Build frontend (unless fix-only mode)
-    if not args.fix_only:
-        if not build_frontend():
+    # Install dependencies, fix configuration and check the backend concurrently;
+    # they touch disjoint files and spend most of their time waiting on subprocesses
+    with concurrent.futures.ThreadPoolExecutor(max_workers=4) as executor:
+        try:
+            tasks = {
+                executor.submit(install_dependencies, args.skip_install or cache_hit, parallel=not args.no_parallel_install, force=args.force_install): "Dependency installation",
+                executor.submit(fix_typescript_config): "TypeScript configuration fix",
+                executor.submit(fix_react_components): "React component check",
+                executor.submit(test_backend): "Backend check",
+            }
+            for future in concurrent.futures.as_completed(tasks):
+                try:
+                    if not future.result():
+                        success = False
+                except Exception as e:
+                    print_error(f"{tasks[future]} failed: {e}")
+                    success = False
+        except BaseException:
+            # e.g. Ctrl-C: kill the installs before the executor waits on their threads
+            kill_live_installs()
+            raise
+    
+    # Build frontend (unless fix-only mode or nothing changed)
+    if not args.fix_only and not cache_hit:
+        # build_frontend only returns True once the bundle is deployed to public/
+        if build_frontend():
+            if success and not args.no_build_cache:
+                # Hash after the fixes so the saved state matches what was built
+                save_build_state(compute_build_state())
+        else:
             success = False
     
-    # Test backend
-    if not test_backend():
-        success = False
-    
     # Generate report
     build_success = generate_report()
     